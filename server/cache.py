@@ -0,0 +1,98 @@
+# server/cache.py
+import asyncio
+import time
+from collections import OrderedDict
+from mcp.server.fastmcp.utilities.logging import get_logger
+
+logger = get_logger("pg-mcp.cache")
+
+class MetadataCache:
+    def __init__(self, maxsize=4096, ttl=60.0):
+        """
+        Initialize an LRU cache whose entries expire after a fixed time-to-live.
+
+        Args:
+            maxsize: Maximum number of entries kept before the least recently used is evicted
+            ttl: Seconds an entry stays valid after it was stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # Map keys to (expiry time, value), oldest first
+        self._locks = {}  # Per-key [lock, users] so concurrent misses only fetch once
+
+    def get(self, key):
+        """
+        Look up a cached value.
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss or expired entry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(self, key, fetch):
+        """
+        Return the cached value for a key, calling fetch() to populate it on a miss.
+
+        Args:
+            key: Cache key; the first element must be the connection ID
+            fetch: Zero-argument coroutine function producing the value
+        """
+        hit, value = self.get(key)
+        if hit:
+            return value
+
+        # Count holders and waiters; lock.locked() is briefly False while a woken waiter
+        # is still queued, so it can't tell whether the lock is safe to drop
+        entry = self._locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                # Another task may have filled the entry while we waited
+                hit, value = self.get(key)
+                if hit:
+                    return value
+
+                value = await fetch()
+                self.set(key, value)
+                return value
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[key]
+
+    def invalidate(self, conn_id=None):
+        """
+        Drop cached entries.
+
+        Args:
+            conn_id: If provided, drop only entries for this connection ID.
+                    If None, drop everything.
+        """
+        if conn_id is None:
+            self._entries.clear()
+            return
+
+        for key in [key for key in self._entries if key[0] == conn_id]:
+            del self._entries[key]
+        logger.debug(f"Invalidated cached metadata for connection ID {conn_id}")
+
+# Shared cache for schema introspection results
+metadata_cache = MetadataCache()
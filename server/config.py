@@ -3,6 +3,7 @@ from mcp.server.fastmcp import FastMCP
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
 from server.database import Database
+from server.resources._sql import PREPARED_STATEMENTS
 from mcp.server.fastmcp.utilities.logging import get_logger
 
 logger = get_logger("pg-mcp.instance")
@@ -12,7 +13,7 @@ logger = get_logger("pg-mcp.instance")
 async def app_lifespan(server: FastMCP) -> AsyncIterator[dict]:
     """Manage application lifecycle."""
     # Startup logic
-    db = Database()
+    db = Database(prepared_statements=PREPARED_STATEMENTS)
     logger.info("Database manager initialized (no connections established yet)")
     mcp.state = {"db": db}
     
@@ -28,5 +29,5 @@ mcp = FastMCP(
     "pg-mcp", 
     debug=True, 
     lifespan=app_lifespan,
-    dependencies=["asyncpg", "mcp"]
+    dependencies=["asyncpg", "mcp", "orjson"]
 )
\ No newline at end of file
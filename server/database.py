@@ -1,4 +1,6 @@
 # server/database.py
+import asyncio
+import re
 import uuid
 import urllib.parse
 import asyncpg
@@ -8,9 +10,17 @@ from mcp.server.fastmcp.utilities.logging import get_logger
 logger = get_logger("pg-mcp.database")
 
 class Database:
-    def __init__(self):
-        """Initialize the database manager with no default connections."""
+    def __init__(self, prepared_statements=None):
+        """
+        Initialize the database manager with no default connections.
+        
+        Args:
+            prepared_statements: Optional mapping of names to SQL that every new pooled
+                connection warms into its statement cache
+        """
+        self._prepared_statements = dict(prepared_statements or {})
         self._pools = {}  # Dictionary to store connection pools by connection ID
+        self._pool_locks = {}  # Per-connection-ID locks so a pool is only created once
         self._connection_map = {}  # Map connection IDs to actual connection strings
         self._reverse_map = {}  # Map connection strings to their IDs
 
@@ -80,21 +90,44 @@ class Database:
             raise ValueError("Connection ID is required")
             
         if conn_id not in self._pools:
-            # Get the actual connection string
-            connection_string = self.get_connection_string(conn_id)
+            # Concurrent first requests for the same connection ID wait for a single pool
+            async with self._pool_locks.setdefault(conn_id, asyncio.Lock()):
+                if conn_id not in self._pools:
+                    # Get the actual connection string
+                    connection_string = self.get_connection_string(conn_id)
             
-            logger.info(f"Creating new database connection pool for connection ID {conn_id}")
-            self._pools[conn_id] = await asyncpg.create_pool(
-                connection_string,
-                min_size=2,
-                max_size=10,
-                command_timeout=60.0,
-                # Read-only mode
-                server_settings={"default_transaction_read_only": "true"}
-            )
+                    logger.info(f"Creating new database connection pool for connection ID {conn_id}")
+                    self._pools[conn_id] = await asyncpg.create_pool(
+                        connection_string,
+                        # Keep enough warm connections for concurrent resource requests
+                        min_size=4,
+                        max_size=32,
+                        max_inactive_connection_lifetime=300.0,
+                        # Room for the catalog statements plus recent user queries; idle ad-hoc
+                        # statements are deallocated instead of held for the life of the connection
+                        statement_cache_size=256,
+                        max_cached_statement_lifetime=300,
+                        command_timeout=60.0,
+                        init=self._init_connection,
+                        # Startup settings survive the RESET ALL asyncpg runs when a connection is released
+                        server_settings={
+                            # Read-only mode
+                            "default_transaction_read_only": "true",
+                            # Enforce the command timeout server-side as well
+                            "statement_timeout": "60s"
+                        }
+                    )
         
         return self
     
+    async def _init_connection(self, conn):
+        """Warm a new pooled connection's statement cache with the registered statements."""
+        for sql in self._prepared_statements.values():
+            # Connection.prepare() bypasses asyncpg's statement cache, so run each statement
+            # once with NULL arguments instead: it is parsed and cached while filters on NULL match no rows
+            param_count = max(map(int, re.findall(r"\$(\d+)", sql)), default=0)
+            await conn.fetch(sql, *([None] * param_count))
+    
     @asynccontextmanager
     async def get_connection(self, conn_id):
         """Get a database connection from the pool for the given connection ID."""
@@ -120,10 +153,12 @@ class Database:
                 logger.info(f"Closing database connection pool for connection ID {conn_id}")
                 await self._pools[conn_id].close()
                 del self._pools[conn_id]
+            self._pool_locks.pop(conn_id, None)
         else:
             # Close all connection pools
             logger.info("Closing all database connection pools")
             for id, pool in list(self._pools.items()):
                 logger.info(f"Closing connection pool for ID {id}")
                 await pool.close()
-                del self._pools[id]
\ No newline at end of file
+                del self._pools[id]
+            self._pool_locks.clear()
\ No newline at end of file
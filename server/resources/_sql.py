@@ -0,0 +1,329 @@
+# server/resources/_sql.py
+# Catalog SQL lives here as module-level constants so every caller sends byte-identical
+# text and hits the same entry in asyncpg's per-connection statement cache.
+
+# Labels for pg_constraint.contype codes, shared by every query that reports constraint types
+CONSTRAINT_TYPES = {
+    'p': 'PRIMARY KEY',
+    'u': 'UNIQUE',
+    'f': 'FOREIGN KEY',
+    'c': 'CHECK',
+    't': 'TRIGGER',
+    'x': 'EXCLUSION',
+}
+
+def constraint_type_desc(column):
+    """Build the SQL CASE expression mapping a contype column to its CONSTRAINT_TYPES label."""
+    whens = " ".join(f"WHEN '{code}' THEN '{label}'" for code, label in CONSTRAINT_TYPES.items())
+    return f"CASE {column} {whens} ELSE 'OTHER' END"
+
+# Describes every non-system schema, with its tables, columns and foreign keys, as one
+# JSON document built entirely in SQL. Partitions are skipped (their parent is listed),
+# and row counts are the planner's estimate (reltuples), which is -1 until the table is
+# first analyzed. json_build_object is used over jsonb to keep keys in declaration order.
+DB_INFO_SQL = f"""
+    WITH rels AS (
+        SELECT c.oid, c.relnamespace, c.relname, c.reltuples
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE 
+            n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
+            AND n.nspname NOT LIKE 'pg_%'
+            AND c.relkind IN ('r', 'p')
+            AND NOT c.relispartition
+    ),
+    cols AS (
+        SELECT 
+            a.attrelid as relid,
+            json_agg(json_build_object(
+                'name', a.attname,
+                'type', format_type(a.atttypid, a.atttypmod),
+                'nullable', NOT a.attnotnull,
+                'default', pg_get_expr(d.adbin, d.adrelid),
+                'description', col_description(a.attrelid, a.attnum),
+                'constraints', ARRAY(
+                    SELECT {constraint_type_desc('con.contype')}
+                    FROM pg_constraint con
+                    WHERE con.conrelid = a.attrelid AND a.attnum = ANY(con.conkey) AND con.conparentid = 0
+                    ORDER BY con.contype, con.conname
+                )
+            ) ORDER BY a.attnum) as columns
+        FROM rels r
+        JOIN pg_attribute a ON a.attrelid = r.oid
+        LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+        WHERE 
+            a.attnum > 0
+            AND NOT a.attisdropped
+        GROUP BY a.attrelid
+    ),
+    fks AS (
+        SELECT 
+            fk.relid,
+            json_agg(json_build_object(
+                'name', fk.conname,
+                'columns', fk.column_names,
+                'referenced_schema', fk.referenced_schema,
+                'referenced_table', fk.referenced_table,
+                'referenced_columns', fk.referenced_columns
+            ) ORDER BY fk.conname) as foreign_keys
+        FROM (
+            -- conkey and confkey are unnested in parallel so multi-column foreign keys keep their pairing
+            SELECT 
+                c.conrelid as relid,
+                c.conname,
+                ARRAY_AGG(col.attname ORDER BY u.attposition) as column_names,
+                nr.nspname as referenced_schema,
+                ref_table.relname as referenced_table,
+                ARRAY_AGG(ref_col.attname ORDER BY u.attposition) as referenced_columns
+            FROM 
+                rels r
+            JOIN 
+                pg_constraint c ON c.conrelid = r.oid
+            JOIN 
+                pg_class ref_table ON ref_table.oid = c.confrelid
+            JOIN 
+                pg_namespace nr ON nr.oid = ref_table.relnamespace
+            LEFT JOIN 
+                LATERAL unnest(c.conkey, c.confkey) WITH ORDINALITY AS u(attnum, ref_attnum, attposition) ON TRUE
+            LEFT JOIN 
+                pg_attribute col ON col.attrelid = c.conrelid AND col.attnum = u.attnum
+            LEFT JOIN 
+                pg_attribute ref_col ON ref_col.attrelid = c.confrelid AND ref_col.attnum = u.ref_attnum
+            WHERE 
+                c.contype = 'f'
+                AND c.conparentid = 0
+            GROUP BY
+                c.conrelid, c.oid, c.conname, nr.nspname, ref_table.relname
+        ) fk
+        GROUP BY fk.relid
+    ),
+    tbls AS (
+        SELECT 
+            r.relnamespace as nsoid,
+            json_agg(json_build_object(
+                'name', r.relname,
+                'description', obj_description(r.oid, 'pg_class'),
+                'row_count', NULLIF(r.reltuples, -1)::bigint,
+                'columns', COALESCE(cols.columns, '[]'::json),
+                'foreign_keys', COALESCE(fks.foreign_keys, '[]'::json)
+            ) ORDER BY r.relname) as tables
+        FROM rels r
+        LEFT JOIN cols ON cols.relid = r.oid
+        LEFT JOIN fks ON fks.relid = r.oid
+        GROUP BY r.relnamespace
+    )
+    SELECT json_build_object(
+        'schemas', COALESCE(json_agg(json_build_object(
+            'name', n.nspname,
+            'description', obj_description(n.oid, 'pg_namespace'),
+            'tables', COALESCE(tbls.tables, '[]'::json)
+        ) ORDER BY n.nspname), '[]'::json)
+    ) as db_info
+    FROM pg_namespace n
+    LEFT JOIN tbls ON tbls.nsoid = n.oid
+    WHERE 
+        n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
+        AND n.nspname NOT LIKE 'pg_%'
+"""
+
+# Catalog queries backing the individual schema resources. The per-table queries resolve
+# ($1 schema, $2 table) to the relation oid once with TABLE_OID_SQL, inside the same
+# statement, and filter the catalogs on that oid.
+TABLE_OID_SQL = "SELECT c.oid FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace WHERE n.nspname = $1 AND c.relname = $2"
+
+SCHEMAS_SQL = """
+    SELECT 
+        n.nspname as schema_name,
+        obj_description(n.oid, 'pg_namespace') as description
+    FROM pg_namespace n
+    WHERE 
+        n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
+        AND n.nspname NOT LIKE 'pg_%'
+    ORDER BY n.nspname
+"""
+
+TABLES_SQL = """
+    SELECT 
+        c.relname as table_name,
+        obj_description(c.oid, 'pg_class') as description,
+        NULLIF(c.reltuples, -1)::bigint as total_rows
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE 
+        n.nspname = $1
+        AND c.relkind IN ('r', 'p')
+    ORDER BY c.relname
+"""
+
+COLUMNS_SQL = f"""
+    SELECT
+        a.attname as column_name,
+        format_type(a.atttypid, a.atttypmod) as data_type,
+        CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END as is_nullable,
+        pg_get_expr(d.adbin, d.adrelid) as column_default,
+        col_description(a.attrelid, a.attnum) as description
+    FROM pg_attribute a
+    LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+    WHERE
+        a.attrelid = ({TABLE_OID_SQL})
+        AND a.attnum > 0
+        AND NOT a.attisdropped
+    ORDER BY a.attnum
+"""
+
+# Index and constraint key columns are resolved in correlated ARRAY() subqueries, so
+# indkey/conkey are only unnested for the rows that survive the WHERE clause and no
+# GROUP BY over the outer columns is needed.
+INDEXES_SQL = f"""
+    SELECT 
+        i.relname as index_name,
+        pg_get_indexdef(i.oid) as index_definition,
+        obj_description(i.oid) as description,
+        am.amname as index_type,
+        ARRAY(
+            SELECT a.attname
+            FROM unnest(ix.indkey) WITH ORDINALITY AS k(attnum, i)
+            LEFT JOIN pg_attribute a ON a.attrelid = ix.indrelid AND a.attnum = k.attnum
+            ORDER BY k.i
+        ) as column_names,
+        ix.indisunique as is_unique,
+        ix.indisprimary as is_primary,
+        ix.indisexclusion as is_exclusion
+    FROM 
+        pg_index ix
+    JOIN 
+        pg_class i ON i.oid = ix.indexrelid
+    JOIN 
+        pg_am am ON i.relam = am.oid
+    WHERE 
+        ix.indrelid = ({TABLE_OID_SQL})
+    ORDER BY 
+        i.relname
+"""
+
+CONSTRAINTS_SQL = f"""
+    SELECT 
+        c.conname as constraint_name,
+        c.contype::text as constraint_type,
+        {constraint_type_desc('c.contype')} as constraint_type_desc,
+        obj_description(c.oid) as description,
+        pg_get_constraintdef(c.oid) as definition,
+        CASE 
+            WHEN c.contype = 'f' THEN 
+                (SELECT nspname FROM pg_namespace WHERE oid = ref_table.relnamespace) || '.' || ref_table.relname
+            ELSE NULL
+        END as referenced_table,
+        ARRAY_AGG(col.attname ORDER BY u.attposition) as column_names
+    FROM 
+        pg_constraint c
+    LEFT JOIN 
+        pg_class ref_table ON ref_table.oid = c.confrelid
+    LEFT JOIN 
+        LATERAL unnest(c.conkey) WITH ORDINALITY AS u(attnum, attposition) ON TRUE
+    LEFT JOIN 
+        pg_attribute col ON col.attrelid = c.conrelid AND col.attnum = u.attnum
+    WHERE 
+        c.conrelid = ({TABLE_OID_SQL})
+        AND c.conparentid = 0
+    GROUP BY
+        c.conname, c.contype, c.oid, ref_table.relname, ref_table.relnamespace
+    ORDER BY 
+        c.contype, c.conname
+"""
+
+INDEX_DETAILS_SQL = f"""
+    SELECT 
+        i.relname as index_name,
+        pg_get_indexdef(i.oid) as index_definition,
+        obj_description(i.oid) as description,
+        am.amname as index_type,
+        ix.indisunique as is_unique,
+        ix.indisprimary as is_primary,
+        ix.indisexclusion as is_exclusion,
+        ix.indimmediate as is_immediate,
+        ix.indisclustered as is_clustered,
+        ix.indisvalid as is_valid,
+        i.relpages as pages,
+        i.reltuples as rows,
+        ARRAY(
+            SELECT a.attname
+            FROM unnest(ix.indkey) WITH ORDINALITY AS k(attnum, i)
+            LEFT JOIN pg_attribute a ON a.attrelid = ix.indrelid AND a.attnum = k.attnum
+            ORDER BY k.i
+        ) as column_names,
+        ARRAY(
+            SELECT pg_get_indexdef(i.oid, k.i::int, false)
+            FROM unnest(ix.indkey) WITH ORDINALITY AS k(attnum, i)
+            ORDER BY k.i
+        ) as column_expressions
+    FROM 
+        pg_index ix
+    JOIN 
+        pg_class i ON i.oid = ix.indexrelid
+    JOIN 
+        pg_am am ON i.relam = am.oid
+    WHERE 
+        ix.indrelid = ({TABLE_OID_SQL})
+        AND i.relname = $3
+"""
+
+CONSTRAINT_DETAILS_SQL = f"""
+    SELECT 
+        c.conname as constraint_name,
+        c.contype::text as constraint_type,
+        {constraint_type_desc('c.contype')} as constraint_type_desc,
+        obj_description(c.oid) as description,
+        pg_get_constraintdef(c.oid) as definition,
+        CASE 
+            WHEN c.contype = 'f' THEN nr.nspname || '.' || ref_table.relname
+            ELSE NULL
+        END as referenced_table,
+        ARRAY(
+            SELECT col.attname
+            FROM unnest(c.conkey) WITH ORDINALITY AS u(attnum, attposition)
+            JOIN pg_attribute col ON col.attrelid = c.conrelid AND col.attnum = u.attnum
+            ORDER BY u.attposition
+        ) as column_names,
+        CASE 
+            WHEN c.contype = 'f' THEN 
+                ARRAY(
+                    SELECT ref_col.attname
+                    FROM unnest(c.confkey) WITH ORDINALITY AS u(attnum, attposition)
+                    JOIN pg_attribute ref_col ON ref_col.attrelid = c.confrelid AND ref_col.attnum = u.attnum
+                    ORDER BY u.attposition
+                )
+            ELSE NULL
+        END as referenced_columns
+    FROM 
+        pg_constraint c
+    LEFT JOIN 
+        pg_class ref_table ON ref_table.oid = c.confrelid
+    LEFT JOIN 
+        pg_namespace nr ON nr.oid = ref_table.relnamespace
+    WHERE 
+        c.conrelid = ({TABLE_OID_SQL})
+        AND c.conname = $3
+"""
+
+# Approximate row count used by the data resources
+ROWCOUNT_SQL = """
+    SELECT 
+        reltuples::bigint AS approximate_row_count
+    FROM pg_class
+    JOIN pg_namespace ON pg_namespace.oid = pg_class.relnamespace
+    WHERE 
+        pg_namespace.nspname = $1 
+        AND pg_class.relname = $2
+"""
+
+# Statements each pooled connection prepares up front (see Database._init_connection)
+PREPARED_STATEMENTS = {
+    'list_schemas': SCHEMAS_SQL,
+    'list_schema_tables': TABLES_SQL,
+    'get_table_columns': COLUMNS_SQL,
+    'get_table_indexes': INDEXES_SQL,
+    'get_table_constraints': CONSTRAINTS_SQL,
+    'get_index_details': INDEX_DETAILS_SQL,
+    'get_constraint_details': CONSTRAINT_DETAILS_SQL,
+    'get_table_rowcount': ROWCOUNT_SQL,
+}
@@ -2,6 +2,7 @@
 from server.config import mcp
 from mcp.server.fastmcp import Context
 from mcp.server.fastmcp.utilities.logging import get_logger
+from server.cache import metadata_cache
 
 logger = get_logger("pg-mcp.tools.connection")
 
@@ -54,6 +55,7 @@ def register_connection_tools():
         # Close the connection pool
         try:
             await db.close(conn_id)
+            metadata_cache.invalidate(conn_id)
             # Also remove from the connection mappings
             connection_string = db._connection_map.pop(conn_id, None)
             if connection_string in db._reverse_map:
@@ -1,11 +1,15 @@
 # server/tools/query.py
+import asyncio
 from server.config import mcp
 from mcp.server.fastmcp import Context
 from mcp.server.fastmcp.utilities.logging import get_logger
 
 logger = get_logger("pg-mcp.tools.query")
 
-async def execute_query(query: str, conn_id: str, params=None, ctx=None):
+# Catalog queries currently running, keyed on (conn_id, query, params), so identical concurrent calls share one result
+_inflight = {}
+
+async def execute_query(query: str, conn_id: str, params=None, ctx=None, coalesce=False):
     """
     Execute a read-only SQL query against the PostgreSQL database.
     
@@ -14,11 +18,42 @@ async def execute_query(query: str, conn_id: str, params=None, ctx=None):
         conn_id: Connection ID (required)
         params: Parameters for the query (optional)
         ctx: Optional request context
+        coalesce: Share one execution between identical concurrent calls on the same
+            connection ID. Only meant for catalog/resource queries; user SQL such as
+            SELECT now() must run once per call.
         
     Returns:
         Query results as a list of dictionaries
     """
+    if not coalesce:
+        return await _run_query(query, conn_id, params, ctx)
+    
+    key = (conn_id, query, tuple(params or []))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable parameters (e.g. lists) can't be coalesced
+        return await _run_query(query, conn_id, params, ctx)
+    
+    task = _inflight.get(key)
+    if task is None:
+        # The query runs in its own task so no single caller's cancellation stops it
+        task = asyncio.create_task(_run_query(query, conn_id, params, ctx))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _query_done(key, t))
     
+    # Shield the shared task so a cancelled caller doesn't cancel it for everyone else
+    return await asyncio.shield(task)
+
+def _query_done(key, task):
+    """Forget a finished shared query, marking its exception retrieved if every caller left."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+async def _run_query(query, conn_id, params=None, ctx=None):
+    """Execute a query on a pooled connection and return its rows as dictionaries."""
     # Access the database from the request context
     # Access the database from either context or MCP state
     if ctx is not None and hasattr(ctx, 'request_context'):
@@ -6,6 +6,181 @@ import sys
 from mcp import ClientSession
 from mcp.client.sse import sse_client
 
+async def check_cache_and_coalescer():
+    """Exercise the metadata cache and the query coalescer without a server or database."""
+    from server.cache import MetadataCache
+    from server.tools import query
+
+    calls = []
+
+    async def fetch(value, delay=0.01, error=None):
+        calls.append(value)
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return value
+
+    # Hit: concurrent misses on one key fetch once, later calls are served from the cache
+    cache = MetadataCache(maxsize=2, ttl=0.2)
+    results = await asyncio.gather(*(cache.get_or_fetch(("c1", "a"), lambda: fetch("a")) for _ in range(5)))
+    assert results == ["a"] * 5 and calls == ["a"], calls
+    assert await cache.get_or_fetch(("c1", "a"), lambda: fetch("a")) == "a" and calls == ["a"], calls
+    assert not cache._locks, cache._locks
+    print("  OK   cache hit")
+
+    # TTL expiry: an entry older than ttl is fetched again
+    await asyncio.sleep(0.25)
+    await cache.get_or_fetch(("c1", "a"), lambda: fetch("a"))
+    assert calls == ["a", "a"], calls
+    print("  OK   cache TTL expiry")
+
+    # LRU eviction: with maxsize=2, touching "a" makes "b" the entry evicted by "c"
+    await cache.get_or_fetch(("c1", "b"), lambda: fetch("b"))
+    await cache.get_or_fetch(("c1", "a"), lambda: fetch("a"))
+    await cache.get_or_fetch(("c1", "c"), lambda: fetch("c"))
+    assert cache.get(("c1", "b")) == (False, None)
+    assert cache.get(("c1", "a")) == (True, "a")
+    print("  OK   cache LRU eviction")
+
+    # Shared failure: a failed fetch reaches the caller and is not cached
+    calls.clear()
+    try:
+        await cache.get_or_fetch(("c1", "err"), lambda: fetch("err", error=RuntimeError("boom")))
+        raise AssertionError("expected RuntimeError")
+    except RuntimeError:
+        pass
+    assert await cache.get_or_fetch(("c1", "err"), lambda: fetch("ok")) == "ok" and calls == ["err", "ok"], calls
+    assert not cache._locks, cache._locks
+    print("  OK   cache failure is not cached")
+
+    # A caller arriving while a waiter is being woken after a failure must queue on the same lock
+    active, peak = 0, 0
+
+    async def tracked_fetch(value, error=None):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            return await fetch(value, error=error)
+        finally:
+            active -= 1
+
+    async def late_caller():
+        while not calls:
+            await asyncio.sleep(0)
+        while active:
+            await asyncio.sleep(0)
+        return await cache.get_or_fetch(("c1", "retry"), lambda: tracked_fetch("late"))
+
+    calls.clear()
+    results = await asyncio.gather(
+        cache.get_or_fetch(("c1", "retry"), lambda: tracked_fetch("first", error=RuntimeError("boom"))),
+        cache.get_or_fetch(("c1", "retry"), lambda: tracked_fetch("waiter")),
+        late_caller(),
+        return_exceptions=True,
+    )
+    assert isinstance(results[0], RuntimeError) and results[1:] == ["waiter", "waiter"], results
+    assert peak == 1 and calls == ["first", "waiter"], (peak, calls)
+    assert not cache._locks, cache._locks
+    print("  OK   cache keeps the lock while a waiter is queued")
+
+    # Cancelled caller: the waiters still get the value and the per-key lock is dropped
+    calls.clear()
+    tasks = [asyncio.create_task(cache.get_or_fetch(("c1", "slow"), lambda: fetch("slow", 0.05))) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    tasks[0].cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError) and results[1:] == ["slow", "slow"], results
+    assert not cache._locks, cache._locks
+    print("  OK   cache cancelled caller")
+
+    # The coalescer runs identical concurrent queries once, without touching a database
+    run_query = query._run_query
+    runs = []
+
+    async def fake_run_query(sql, conn_id, params=None, ctx=None):
+        runs.append(sql)
+        await asyncio.sleep(0.05)
+        if sql == "fail":
+            raise RuntimeError("boom")
+        return [{"sql": sql}]
+
+    query._run_query = fake_run_query
+    try:
+        results = await asyncio.gather(*(query.execute_query("q", "c1", coalesce=True) for _ in range(5)))
+        assert results == [[{"sql": "q"}]] * 5 and runs == ["q"], runs
+        assert not query._inflight
+        print("  OK   coalescer shares one execution")
+
+        runs.clear()
+        results = await asyncio.gather(*(query.execute_query("fail", "c1", coalesce=True) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results) and runs == ["fail"], (results, runs)
+        assert not query._inflight
+        print("  OK   coalescer shares a failure")
+
+        runs.clear()
+        tasks = [asyncio.create_task(query.execute_query("q", "c1", coalesce=True)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        tasks[0].cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert isinstance(results[0], asyncio.CancelledError) and results[1:] == [[{"sql": "q"}]] * 2, results
+        assert runs == ["q"] and not query._inflight, runs
+        print("  OK   coalescer survives a cancelled caller")
+
+        runs.clear()
+        await asyncio.gather(*(query.execute_query("q", "c1") for _ in range(2)))
+        assert runs == ["q", "q"], runs
+        print("  OK   uncoalesced queries run per call")
+    finally:
+        query._run_query = run_query
+
+async def read_resource_json(session, uri):
+    """Read a resource and decode its JSON text content."""
+    response = await session.read_resource(uri)
+    return json.loads(response.contents[0].text)
+
+async def read_every_resource(session, conn_id, schema_name, table_name):
+    """Read every resource template for one table and report any that fail."""
+    base = f"pgmcp://{conn_id}"
+    table_base = f"{base}/schemas/{schema_name}/tables/{table_name}"
+    uris = [
+        f"{base}/",
+        f"{base}/schemas",
+        f"{base}/schemas/{schema_name}/tables",
+        f"{base}/schemas/{schema_name}/extensions",
+        f"{table_base}/columns",
+        f"{table_base}/indexes",
+        f"{table_base}/constraints",
+        f"{table_base}/sample",
+        f"{table_base}/rowcount",
+    ]
+
+    failures = 0
+    results = {}
+    for uri in uris:
+        try:
+            results[uri] = await read_resource_json(session, uri)
+            print(f"  OK   {uri}")
+        except Exception as e:
+            failures += 1
+            print(f"  FAIL {uri}: {type(e).__name__}: {e}")
+
+    # Detail resources need a name taken from the listing resources
+    for listing, name_key in (("indexes", "index_name"), ("constraints", "constraint_name")):
+        items = results.get(f"{table_base}/{listing}") or []
+        if not items:
+            print(f"  SKIP {table_base}/{listing}/{{name}}: table has no {listing}")
+            continue
+        uri = f"{table_base}/{listing}/{items[0][name_key]}"
+        try:
+            await read_resource_json(session, uri)
+            print(f"  OK   {uri}")
+        except Exception as e:
+            failures += 1
+            print(f"  FAIL {uri}: {type(e).__name__}: {e}")
+
+    return failures
+
 async def run(connection_string: str | None):
     """Test the MCP server with an optional database connection string."""
     # Assuming your server is running on localhost:8000
@@ -291,7 +466,10 @@ async def run(connection_string: str | None):
                                                                     print(f"  ... and {len(columns_data) - 3} more")
                                                                     break
                                                     
-                                                    # Test disconnect tool if available
+                                                    print(f"\nReading every resource for table '{schema_name}.{table_name}'...")
+                                                    failures = await read_every_resource(session, conn_id, schema_name, table_name)
+                                                    print(f"{failures} resource(s) failed")
+
                                                     break  # Exit schema loop once we've found a table
                                 except json.JSONDecodeError:
                                     print(f"Error parsing schemas: {content_item.text[:100]}")
@@ -339,6 +517,11 @@ async def run(connection_string: str | None):
         print(f"Error: {type(e).__name__}: {e}")
 
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--self-check"]:
+        print("Checking the metadata cache and query coalescer...")
+        asyncio.run(check_cache_and_coalescer())
+        sys.exit()
+
     # Get database connection string from command line argument
     connection_string = sys.argv[1] if len(sys.argv) > 1 else None
     asyncio.run(run(connection_string))
\ No newline at end of file